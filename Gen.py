@@ -1,64 +1,141 @@
+import hashlib
 import os
-from Crypto.Hash import SHA256, RIPEMD160
+from typing import Iterator, List, NamedTuple, Optional
+
 import base58
 import ecdsa
 from bech32 import bech32_encode, convertbits
 
-def generate_bitcoin_address():
-    # Generate private key
-    private_key = os.urandom(32)
-    fullkey = '80' + private_key.hex()
-    sha256a = SHA256.new(bytes.fromhex(fullkey)).hexdigest()
-    sha256b = SHA256.new(bytes.fromhex(sha256a)).hexdigest()
-    WIF = base58.b58encode(bytes.fromhex(fullkey + sha256b[:8]))
-
-    # Get public key
-    sk = ecdsa.SigningKey.from_string(private_key, curve=ecdsa.SECP256k1)
-    vk = sk.get_verifying_key()
-    x = vk.pubkey.point.x()
-    y = vk.pubkey.point.y()
-    public_key = '04' + x.to_bytes(32, 'big').hex() + y.to_bytes(32, 'big').hex()
-
-    # Get compressed public key
-    compressed_public_key = '02' if y % 2 == 0 else '03'
-    compressed_public_key += x.to_bytes(32, 'big').hex()
-
-    # Get P2PKH address
-    hash160 = RIPEMD160.new()
-    hash160.update(SHA256.new(bytes.fromhex(public_key)).digest())
-    public_key_hash = '00' + hash160.hexdigest()
-    checksum = SHA256.new(SHA256.new(bytes.fromhex(public_key_hash)).digest()).hexdigest()[:8]
-    p2pkh_address = base58.b58encode(bytes.fromhex(public_key_hash + checksum))
-
-    # Get compressed P2PKH address
-    hash160 = RIPEMD160.new()
-    hash160.update(SHA256.new(bytes.fromhex(compressed_public_key)).digest())
-    public_key_hash = '00' + hash160.hexdigest()
-    checksum = SHA256.new(SHA256.new(bytes.fromhex(public_key_hash)).digest()).hexdigest()[:8]
-    compressed_p2pkh_address = base58.b58encode(bytes.fromhex(public_key_hash + checksum))
-
-    # Get P2SH address
-    redeem_script = '21' + compressed_public_key + 'ac'
-    hash160 = RIPEMD160.new()
-    hash160.update(SHA256.new(bytes.fromhex(redeem_script)).digest())
-    script_hash = '05' + hash160.hexdigest()
-    checksum = SHA256.new(SHA256.new(bytes.fromhex(script_hash)).digest()).hexdigest()[:8]
-    p2sh_address = base58.b58encode(bytes.fromhex(script_hash + checksum))
-
-    # Get Bech32 address
-    witness_program = bytes([0x00, 0x14]) + hash160.digest()
-    bech32_address = bech32_encode('bc', convertbits(witness_program, 8, 5))
-
-    return {
-        'private_key': private_key.hex(),
-        'WIF': WIF.decode(),
-        'public_key': public_key,
-        'compressed_public_key': compressed_public_key,
-        'p2pkh_address': p2pkh_address.decode(),
-        'compressed_p2pkh_address': compressed_p2pkh_address.decode(),
-        'p2sh_address': p2sh_address.decode(),
-        'bech32_address': bech32_address
-    }
+# Curve constants hoisted out of the per-address path
+_CURVE = ecdsa.SECP256k1
+_G = _CURVE.generator
+_ORDER = _CURVE.order
+
+# hashlib's digests run in OpenSSL's C code (with hardware SHA where the
+# CPU has it), so they're preferred over the pycryptodome equivalents.
+# RIPEMD160 is a legacy algorithm that some OpenSSL 3 builds drop; probe
+# for it once and keep a prototype to copy() so the name lookup isn't
+# repeated per call, falling back to pycryptodome where it's missing.
+_sha256 = hashlib.sha256
+
+try:
+    _RIPEMD160_PROTO = hashlib.new('ripemd160')
+
+    def _hash160(data: bytes) -> bytes:
+        """RIPEMD160(SHA256(data)) — the address payload hash"""
+        ripemd = _RIPEMD160_PROTO.copy()
+        ripemd.update(_sha256(data).digest())
+        return ripemd.digest()
+except ValueError:
+    from Crypto.Hash import RIPEMD160
+
+    def _hash160(data: bytes) -> bytes:
+        """RIPEMD160(SHA256(data)) — the address payload hash"""
+        return RIPEMD160.new(_sha256(data).digest()).digest()
+
+def _sha256d(data: bytes) -> bytes:
+    """Double SHA256, the checksum hash of Base58Check and WIF"""
+    return _sha256(_sha256(data).digest()).digest()
+
+def _base58check(payload: bytes) -> str:
+    """Base58Check-encodes a versioned payload"""
+    return base58.b58encode(payload + _sha256d(payload)[:4]).decode()
+
+class AddressRecord(NamedTuple):
+    """Every derived form of one private key, in a fixed tuple layout
+
+    A namedtuple costs one contiguous allocation and C-speed attribute
+    access, where the dict it replaces paid a hash table and a string
+    hash per field read in the probe loop. The uncompressed-pubkey
+    fields sit at the end and stay None unless explicitly requested.
+    """
+    private_key: str
+    WIF: str
+    compressed_public_key: str
+    compressed_p2pkh_address: str
+    p2sh_address: str
+    bech32_address: str
+    # Raw 20-byte hashes, so callers can match on HASH160 directly
+    # without re-decoding the encoded addresses
+    compressed_hash160: bytes
+    script_hash160: bytes
+    public_key: Optional[str] = None
+    p2pkh_address: Optional[str] = None
+    p2pkh_hash160: Optional[bytes] = None
+
+def _address_record(private_key: bytes, point, include_uncompressed: bool = False) -> AddressRecord:
+    """Builds the address record for a private key and its public point
+
+    The uncompressed-pubkey P2PKH form has been obsolete in wallets for a
+    decade; it is only derived on request, which drops one HASH160 and one
+    Base58 encode per record.
+    """
+    y = point.y()
+    x_bytes = point.x().to_bytes(32, 'big')
+    compressed_public_key = (b'\x02' if y % 2 == 0 else b'\x03') + x_bytes
+
+    compressed_hash160 = _hash160(compressed_public_key)
+    # P2SH-wrapped pay-to-pubkey redeem script: PUSH33 <pubkey> CHECKSIG
+    script_hash160 = _hash160(b'\x21' + compressed_public_key + b'\xac')
+
+    if include_uncompressed:
+        public_key = b'\x04' + x_bytes + y.to_bytes(32, 'big')
+        p2pkh_hash160 = _hash160(public_key)
+        uncompressed = (public_key.hex(),
+                        _base58check(b'\x00' + p2pkh_hash160),
+                        p2pkh_hash160)
+    else:
+        uncompressed = (None, None, None)
+
+    return AddressRecord(
+        private_key.hex(),
+        _base58check(b'\x80' + private_key),
+        compressed_public_key.hex(),
+        _base58check(b'\x00' + compressed_hash160),
+        _base58check(b'\x05' + script_hash160),
+        # P2WPKH: the witness program is the compressed public key's HASH160
+        bech32_encode('bc', [0] + convertbits(compressed_hash160, 8, 5)),
+        compressed_hash160,
+        script_hash160,
+        *uncompressed
+    )
+
+def gen_sequential_batch(k0: int, m: int, include_uncompressed: bool = False) -> Iterator[AddressRecord]:
+    """
+    Yields AddressRecords for the m consecutive private keys starting at k0.
+
+    A full scalar multiplication is paid once for k0; every following key
+    reuses the previous public point with a single point addition of G,
+    which is orders of magnitude cheaper. For a collision search a random
+    run of consecutive keys covers the keyspace as well as m independent
+    draws, since the starting point is uniform over the whole order.
+    """
+    k = k0 % _ORDER or 1
+    point = k * _G
+    for _ in range(m):
+        yield _address_record(k.to_bytes(32, 'big'), point, include_uncompressed)
+        k += 1
+        if k == _ORDER:
+            k = 1
+            point = _G
+        else:
+            point = point + _G
 
+def generate_batch(n: int, include_uncompressed: bool = False) -> List[AddressRecord]:
+    """
+    Generates n keypairs and returns their address records.
 
+    The whole pipeline works on bytes — version byte concatenation instead
+    of hex string round trips — and each batch walks a k·G ladder from one
+    random starting key, so both the expensive scalar multiplication and
+    the getrandom syscall behind os.urandom are paid once per batch rather
+    than once per address.
+    """
+    seed = os.urandom(32)
+    return list(gen_sequential_batch(int.from_bytes(seed, 'big'), n,
+                                     include_uncompressed))
 
+def generate_bitcoin_address(include_uncompressed: bool = True) -> AddressRecord:
+    # Generate private key, derive the public point and every address form;
+    # the single-record entry point keeps the historical full output
+    return generate_batch(1, include_uncompressed)[0]
@@ -5,206 +5,329 @@ Dedicated to: https://bitinfocharts.com/top-100-dormant_1y-bitcoin-addresses.htm
 """
 
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from urllib3.util.retry import Retry
 import time
+
+# httpx multiplexes all page fetches over one HTTP/2 connection; fall back if missing
+try:
+    import httpx
+except ImportError:
+    httpx = None
 import re
 import argparse
 import sys
-from typing import List, Dict
+import json
+import threading
+
+# orjson serializes 10k+ record lists far faster than stdlib json; fall back if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+from operator import itemgetter
+from typing import List, Dict, Optional
 from datetime import datetime
 import os
 
+# How many pages are fetched in parallel per batch
+FETCH_WORKERS = 8
+# Requests per second across all fetch workers
+FETCH_RATE = 5.0
+# How many worker processes parse fetched pages
+PARSE_WORKERS = min(FETCH_WORKERS, os.cpu_count() or 1)
+# Rows a BitInfoCharts top-list page holds, used to bound the page span up front
+ADDRESSES_PER_PAGE = 100
+
+HTTP_ERRORS = (requests.RequestException, httpx.HTTPError) if httpx else (requests.RequestException,)
+
+# Compiled once at import time; re.search would pay a pattern-cache lookup per row
+BTC_RE = re.compile(r'(\d+(?:,\d+)*\.?\d*)\s*BTC')
+USD_RE = re.compile(r'\$([\d,]+)')
+PCT_RE = re.compile(r'(\d+\.?\d*)%')
+
+# One record template per output shape, keyed on (has usd, has percentage), so
+# rendering is a dict lookup plus a single format call per record instead of
+# several conditional writes
+_RECORD_TAIL = (
+    "     First transaction: {first_in}\n"
+    "     Last transaction: {last_in}\n"
+    "     Incoming transactions: {ins_count}\n\n"
+)
+RECORD_TEMPLATES = {
+    (True, True): (
+        "{i:4d}. Address: {address}\n"
+        "     Balance: {balance_btc:,.2f} BTC (${balance_usd:,})\n"
+        "     Percentage: {percentage:.4f}%\n" + _RECORD_TAIL
+    ),
+    (True, False): (
+        "{i:4d}. Address: {address}\n"
+        "     Balance: {balance_btc:,.2f} BTC (${balance_usd:,})\n" + _RECORD_TAIL
+    ),
+    (False, True): (
+        "{i:4d}. Address: {address}\n"
+        "     Balance: {balance_btc:,.2f} BTC\n"
+        "     Percentage: {percentage:.4f}%\n" + _RECORD_TAIL
+    ),
+    (False, False): (
+        "{i:4d}. Address: {address}\n"
+        "     Balance: {balance_btc:,.2f} BTC\n" + _RECORD_TAIL
+    ),
+}
+
+class RateLimiter:
+    """Token-bucket pacing shared by the concurrent fetch workers"""
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        """Blocks until the caller may issue its request"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+def parse_dormant_table(html_content: bytes, verbose: bool = False) -> List[Dict]:
+    """Parses the table of dormant Bitcoin addresses
+
+    Module-level (not a method) so it can be dispatched to worker
+    processes, which need a picklable callable.
+    """
+    tree = lxml.html.fromstring(html_content)
+    addresses = []
+
+    # Both tables (tblOne and tblOne2) in a single traversal
+    tables = tree.xpath('//table[@id="tblOne" or @id="tblOne2"]')
+
+    # Fallback: search by class if not found by ID
+    if not tables:
+        tables = tree.xpath('//table[contains(@class, "table-striped") or contains(@class, "abtb")]')
+
+    if not tables:
+        print("No dormant addresses table found")
+        return addresses
+
+    # Process each table
+    for table_idx, table in enumerate(tables):
+        # tr[td] excludes header rows (th-only) at libxml2 level
+        rows = table.xpath('.//tr[td]')
+
+        # Parsing rows
+        for row in rows:
+            if len(row.xpath('td')) >= 5:  # At least 5 columns for dormant addresses
+                try:
+                    # One XPath pulls the address link out of the second cell
+                    hrefs = row.xpath('td[2]//a[contains(@href, "/bitcoin/address/")]/@href')
+
+                    if hrefs:
+                        # Extract complete address from URL
+                        address = hrefs[0].split('/bitcoin/address/')[-1]
+                    else:
+                        # Fallback: use cell text, dropping any trailing "wallet:..." label
+                        address = row.xpath('string(td[2])').strip()
+                        address = address.split('wallet:', 1)[0].strip()
+
+                    # Extract balance (third column)
+                    balance_text = row.xpath('string(td[3])').strip()
+
+                    # Extract BTC value
+                    btc_match = BTC_RE.search(balance_text)
+                    btc_amount = None
+                    if btc_match:
+                        btc_amount = float(btc_match.group(1).replace(',', ''))
+
+                    # Extract USD value
+                    usd_match = USD_RE.search(balance_text)
+                    usd_amount = None
+                    if usd_match:
+                        usd_amount = int(usd_match.group(1).replace(',', ''))
+
+                    # Extract percentage (fourth column)
+                    percent_text = row.xpath('string(td[4])').strip()
+                    percent_match = PCT_RE.search(percent_text)
+                    percentage = None
+                    if percent_match:
+                        percentage = float(percent_match.group(1))
+
+                    # Extract dates (fifth and sixth column)
+                    first_in_date = row.xpath('string(td[5])').strip()
+                    last_in_date = row.xpath('string(td[6])').strip()
+
+                    # Extract incoming transactions count (seventh column)
+                    ins_count = row.xpath('string(td[7])').strip()
+
+                    if address and btc_amount and len(address) > 20:
+                        addresses.append({
+                            'address': address,
+                            'balance_btc': btc_amount,
+                            'balance_usd': usd_amount,
+                            'percentage': percentage,
+                            'first_in': first_in_date,
+                            'last_in': last_in_date,
+                            'ins_count': ins_count,
+                        })
+                        # Per-row output dominates parse time on large scrapes
+                        if verbose:
+                            print(f"Dormant address extracted from table {table_idx + 1}: {address} - {btc_amount} BTC")
+                        
+                except Exception as e:
+                    print(f"ERROR in table {table_idx + 1}, row: {e}")
+                    continue
+    
+    if verbose:
+        print(f"DEBUG: Total dormant addresses extracted from all tables: {len(addresses)}")
+    return addresses
+
+def parse_page(html_content: bytes, verbose: bool = False) -> Optional[List[Dict]]:
+    """Parse-pool entry point; None marks a page whose fetch failed"""
+    if not html_content:
+        return None
+    return parse_dormant_table(html_content, verbose)
+
 class BitcoinDormantScraper:
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
         self.base_url = "https://bitinfocharts.com/top-100-dormant_1y-bitcoin-addresses.html"
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
+            # Brotli compresses the HTML tables far better than gzip; decoded
+            # transparently as long as the brotli package is installed
+            'Accept-Encoding': 'gzip, deflate, br'
         })
+        # Pool sized for the concurrent batch fetches, with retries on transient errors
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=2 * FETCH_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self.session.mount('https://', adapter)
+        # One HTTP/2 connection multiplexes all concurrent page fetches
+        if httpx is not None:
+            self.http_client = httpx.Client(
+                http2=True,
+                headers=dict(self.session.headers),
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=1)
+            )
+        else:
+            self.http_client = None
+        self.rate_limiter = RateLimiter(FETCH_RATE)
         self.addresses = []
+        self._seen = set()
         
-    def get_page_content(self, url: str) -> str:
-        """Retrieves the content of a page"""
+    def get_page_content(self, url: str) -> bytes:
+        """Retrieves the raw content of a page
+
+        Returns bytes: lxml parses them directly and skips a Unicode
+        decode pass over the whole document.
+        """
         try:
-            response = self.session.get(url, timeout=30)
+            if self.http_client is not None:
+                response = self.http_client.get(url)
+            else:
+                response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
+            return response.content
+        except HTTP_ERRORS as e:
             print(f"Error retrieving page {url}: {e}")
-            return ""
-    
-    def parse_dormant_table(self, html_content: str) -> List[Dict]:
+            return b""
+
+    def fetch_pages(self, urls: List[str]) -> List[bytes]:
+        """Fetches several pages concurrently, preserving the input order"""
+        def fetch(url: str) -> bytes:
+            self.rate_limiter.wait()
+            return self.get_page_content(url)
+
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            return list(executor.map(fetch, urls))
+
+    def parse_dormant_table(self, html_content: bytes) -> List[Dict]:
         """Parses the table of dormant Bitcoin addresses"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        addresses = []
-        
-        # Search for both tables: tblOne and tblOne2
-        tables = []
-        
-        # First table (tblOne)
-        table1 = soup.find('table', {'id': 'tblOne'})
-        if table1:
-            tables.append(table1)
-        
-        # Second table (tblOne2) 
-        table2 = soup.find('table', {'id': 'tblOne2'})
-        if table2:
-            tables.append(table2)
-        
-        # Fallback: search by class if not found by ID
-        if not tables:
-            fallback_tables = soup.find_all('table', {'class': ['table-striped', 'abtb']})
-            if fallback_tables:
-                tables = fallback_tables
-        
-        if not tables:
-            print("No dormant addresses table found")
-            return addresses
-                
-        # Process each table
-        for table_idx, table in enumerate(tables):            
-            all_rows = table.find_all('tr')
-
-            # Skip header if present
-            rows = all_rows
-            if all_rows and all_rows[0].find('th'):
-                rows = all_rows[1:]  # Skip header
-            
-            # Parsing rows
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 5:  # At least 5 columns for dormant addresses
-                    try:
-                        # Extract address from second column (index 1)
-                        address_cell = cells[1]
-                        
-                        # Search for Bitcoin address link
-                        address_link = None
-                        for link in address_cell.find_all('a'):
-                            href = link.get('href', '')
-                            if '/bitcoin/address/' in href:
-                                address_link = link
-                                break
-                        
-                        if address_link:
-                            # Extract complete address from URL
-                            href = address_link.get('href', '')
-                            address = href.split('/bitcoin/address/')[-1]
-                        else:
-                            # Fallback: use cell text
-                            address = address_cell.text.strip()
-                            address = re.sub(r'wallet:.*$', '', address).strip()
-                        
-                        # Extract balance (third column - index 2)
-                        balance_cell = cells[2]
-                        balance_text = balance_cell.text.strip()
-                        
-                        # Extract BTC value
-                        btc_match = re.search(r'(\d+(?:,\d+)*\.?\d*)\s*BTC', balance_text)
-                        btc_amount = None
-                        if btc_match:
-                            btc_amount = float(btc_match.group(1).replace(',', ''))
-                        
-                        # Extract USD value
-                        usd_match = re.search(r'\$([\d,]+)', balance_text)
-                        usd_amount = None
-                        if usd_match:
-                            usd_amount = int(usd_match.group(1).replace(',', ''))
-                        
-                        # Extract percentage (fourth column - index 3)
-                        percent_cell = cells[3]
-                        percent_text = percent_cell.text.strip()
-                        percent_match = re.search(r'(\d+\.?\d*)%', percent_text)
-                        percentage = None
-                        if percent_match:
-                            percentage = float(percent_match.group(1))
-                        
-                        # Extract dates (fifth and sixth column - index 4 and 5)
-                        first_in_cell = cells[4]
-                        last_in_cell = cells[5]
-                        first_in_date = first_in_cell.text.strip()
-                        last_in_date = last_in_cell.text.strip()
-                        
-                        # Extract incoming transactions count (seventh column - index 6)
-                        ins_cell = cells[6]
-                        ins_count = ins_cell.text.strip()
-                        
-                        if address and btc_amount and len(address) > 20:
-                            addresses.append({
-                                'address': address,
-                                'balance_btc': btc_amount,
-                                'balance_usd': usd_amount,
-                                'percentage': percentage,
-                                'first_in': first_in_date,
-                                'last_in': last_in_date,
-                                'ins_count': ins_count,
-                            })
-                            print(f"Dormant address extracted from table {table_idx + 1}: {address} - {btc_amount} BTC")
-                            
-                    except Exception as e:
-                        print(f"ERROR in table {table_idx + 1}, row: {e}")
-                        continue
-        
-        print(f"DEBUG: Total dormant addresses extracted from all tables: {len(addresses)}")
-        return addresses
-    
-    def get_next_page_url(self, current_page: int) -> str:
-        """Finds the URL of the next page"""
+        return parse_dormant_table(html_content, self.verbose)
+
+    def get_page_url(self, page: int) -> str:
+        """Builds the URL of a specific page"""
+        if page == 1:
+            return self.base_url
+        return f"https://bitinfocharts.com/top-100-dormant_{page}y-bitcoin-addresses.html"
 
-        return f"https://bitinfocharts.com/top-100-dormant_{current_page + 1}y-bitcoin-addresses.html"
-    
     def scrape_dormant_addresses(self, max_addresses: int = 10000, start_page: int = 1) -> List[Dict]:
         """Scrapes dormant addresses starting from a specific page"""
         print(f"Starting scraping for {max_addresses} dormant addresses, starting from page {start_page}...")
-        
-        # Build initial URL
-        if start_page == 1:
-            current_url = self.base_url
-        else:
-            current_url = f"https://bitinfocharts.com/top-100-dormant_{start_page}y-bitcoin-addresses.html"
-        
+
         page_num = start_page
         total_addresses = 0
-        
-        while total_addresses < max_addresses:
-            print(f"\nScraping page {page_num}: {current_url}")
-            
-            html_content = self.get_page_content(current_url)
-            if not html_content:
-                print(f"Unable to retrieve page {page_num}")
-                break
-            
-            page_addresses = self.parse_dormant_table(html_content)
-            
-            if not page_addresses:
-                print(f"No dormant address found on page {page_num}")
-                break
-            
-            for addr in page_addresses:
-                if total_addresses < max_addresses:
-                    self.addresses.append(addr)
-                    total_addresses += 1
-                else:
-                    break
-            
-            print(f"Dormant addresses extracted so far: {total_addresses}")
-            
-            next_url = self.get_next_page_url(page_num)
-            if next_url == current_url:
-                print("No next page found")
-                break
-            
-            current_url = next_url
-            page_num += 1
-            
-            time.sleep(2)
-        
+        done = False
+
+        # Each page holds ~100 rows, so the page span needed to satisfy the cap
+        # is known up front and fetches never run past it
+        last_page = start_page + (max_addresses + ADDRESSES_PER_PAGE - 1) // ADDRESSES_PER_PAGE - 1
+
+        # One pipeline worker prefetches the next batch while this thread parses
+        # the current one, so network wait overlaps parse time; the process pool
+        # spreads the CPU-bound page parsing across cores
+        with ThreadPoolExecutor(max_workers=1) as pipeline, \
+             ProcessPoolExecutor(max_workers=PARSE_WORKERS) as parse_pool:
+            def submit_batch(first_page):
+                batch_end = min(first_page + FETCH_WORKERS, last_page + 1)
+                urls = [self.get_page_url(p) for p in range(first_page, batch_end)]
+                return pipeline.submit(self.fetch_pages, urls)
+
+            next_batch = submit_batch(page_num)
+
+            while not done and total_addresses < max_addresses and page_num <= last_page:
+                batch_pages = range(page_num, page_num + FETCH_WORKERS)
+                print(f"\nScraping pages {page_num}-{page_num + FETCH_WORKERS - 1}...")
+                pages = next_batch.result()
+                next_batch = submit_batch(page_num + FETCH_WORKERS)
+
+                parsed = parse_pool.map(partial(parse_page, verbose=self.verbose), pages)
+
+                for page, page_addresses in zip(batch_pages, parsed):
+                    if page_addresses is None:
+                        print(f"Unable to retrieve page {page}")
+                        done = True
+                        break
+
+                    if not page_addresses:
+                        print(f"No dormant address found on page {page}")
+                        done = True
+                        break
+
+                    # Drop duplicates from pagination overlap, then take what fits
+                    # under the cap in one slice instead of a per-row counter loop
+                    remaining = max_addresses - total_addresses
+                    fresh = {a['address']: a for a in page_addresses if a['address'] not in self._seen}
+                    chunk = list(fresh.values())[:remaining]
+                    self._seen.update(a['address'] for a in chunk)
+                    self.addresses.extend(chunk)
+                    total_addresses += len(chunk)
+
+                    print(f"Dormant addresses extracted so far: {total_addresses}")
+
+                    if total_addresses >= max_addresses:
+                        break
+
+                page_num += FETCH_WORKERS
+
+            next_batch.cancel()
+
         print(f"\nScraping completed. Total dormant addresses extracted: {len(self.addresses)}")
         return self.addresses
     
     def sort_addresses(self):
         """Sorts addresses by BTC balance in descending order"""
-        self.addresses.sort(key=lambda x: x['balance_btc'], reverse=True)
+        # itemgetter is a C-level key function, cheaper than a lambda per element
+        self.addresses.sort(key=itemgetter('balance_btc'), reverse=True)
     
     def save_to_file(self, filename: str = "bitcoin_dormant_addresses.txt", append: bool = False):
         """Saves dormant addresses to a text file with full details"""
@@ -212,63 +335,88 @@ class BitcoinDormantScraper:
             mode = 'a' if append else 'w'  # 'a' for append, 'w' for overwrite
             action = "added to" if append else "overwritten"
             
-            with open(filename, mode, encoding='utf-8') as f:
+            extraction_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+            # Wide buffer + batched writelines: one syscall per batch instead of
+            # several write calls per address
+            with open(filename, mode, encoding='utf-8', buffering=1 << 20) as f:
                 if append:
                     # If we're adding, insert a separator
                     f.write(f"\n\n--- NEW SCRAPING SESSION ---\n")
-                    f.write(f"Extraction date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    f.write(f"Extraction date: {extraction_date}\n")
                     f.write(f"Addresses added: {len(self.addresses)}\n\n")
                 else:
                     # If we're overwriting, write complete header
                     f.write("Dormant Bitcoin Addresses (1 year) - Sorted by balance\n")
                     f.write("=" * 80 + "\n\n")
-                    f.write(f"Extraction date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    f.write(f"Extraction date: {extraction_date}\n")
                     f.write(f"Source: {self.base_url}\n\n")
-                
-                for i, addr in enumerate(self.addresses, 1):
-                    f.write(f"{i:4d}. Address: {addr['address']}\n")
-                    f.write(f"     Balance: {addr['balance_btc']:,.2f} BTC")
-                    if addr['balance_usd']:
-                        f.write(f" (${addr['balance_usd']:,})")
-                    f.write("\n")
-                    if addr['percentage']:
-                        f.write(f"     Percentage: {addr['percentage']:.4f}%\n")
-                    f.write(f"     First transaction: {addr['first_in']}\n")
-                    f.write(f"     Last transaction: {addr['last_in']}\n")
-                    f.write(f"     Incoming transactions: {addr['ins_count']}\n")
-                    f.write("\n")
+
+                f.write("".join(
+                    RECORD_TEMPLATES[(bool(addr['balance_usd']), bool(addr['percentage']))].format(i=i, **addr)
+                    for i, addr in enumerate(self.addresses, 1)
+                ))
             
             print(f"Dormant addresses with full details {action} {filename}")
             
         except Exception as e:
             print(f"Error saving file: {e}")
     
+    def _convert_legacy_json_array(self, filename: str):
+        """Rewrites a legacy JSON-array file as JSON Lines, once"""
+        with open(filename, 'rb') as f:
+            head = f.read(64).lstrip()
+        if not head.startswith(b'['):
+            return  # already JSON Lines (or empty)
+
+        with open(filename, 'rb') as f:
+            if orjson:
+                records = orjson.loads(f.read())
+            else:
+                records = json.load(f)
+
+        with open(filename, 'wb') as f:
+            for record in records:
+                if orjson:
+                    f.write(orjson.dumps(record) + b"\n")
+                else:
+                    f.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n")
+
     def save_to_json(self, filename: str = "bitcoin_dormant_addresses.json", append: bool = False):
-        """Saves dormant addresses in JSON format"""
+        """Saves dormant addresses in JSON format
+
+        Overwrite mode writes a pretty-printed JSON array. Append mode
+        writes JSON Lines (one record per line), so appending only costs
+        the new records instead of re-reading and rewriting the whole
+        file on every session; a legacy array file is converted to JSON
+        Lines the first time it is appended to.
+        """
         try:
-            if append and os.path.exists(filename):
-                # If we're adding and file exists, read existing data
-                try:
-                    with open(filename, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-                    # Add new data
-                    existing_data.extend(self.addresses)
-                    data_to_save = existing_data
-                    action = "updated"
-                except (json.JSONDecodeError, FileNotFoundError):
-                    # If file is not valid JSON, overwrite
-                    data_to_save = self.addresses
-                    action = "overwritten"
+            if append:
+                if os.path.exists(filename):
+                    try:
+                        self._convert_legacy_json_array(filename)
+                    except ValueError:
+                        # Not valid JSON: start over below by appending to it anyway
+                        pass
+                with open(filename, 'ab') as f:
+                    for record in self.addresses:
+                        if orjson:
+                            f.write(orjson.dumps(record) + b"\n")
+                        else:
+                            f.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n")
+                action = "updated"
             else:
-                # Overwrite or create new file
-                data_to_save = self.addresses
+                if orjson:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(self.addresses, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        json.dump(self.addresses, f, indent=2, ensure_ascii=False)
                 action = "overwritten"
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, indent=2, ensure_ascii=False)
-            
+
             print(f"Dormant addresses {action} in JSON format: {filename}")
-            
+
         except Exception as e:
             print(f"Error saving JSON file: {e}")
     
@@ -279,10 +427,10 @@ class BitcoinDormantScraper:
             action = "added to" if append else "overwritten"
             
             with open(filename, mode, encoding='utf-8') as f:
-                
-                for addr in self.addresses:
-                    f.write(f"{addr['address']}\n")
-            
+                # One write call for the whole file instead of one per address
+                if self.addresses:
+                    f.write("\n".join(addr['address'] for addr in self.addresses) + "\n")
+
             print(f"Dormant addresses (addresses only) {action} {filename}")
             print(f"File contains {len(self.addresses)} addresses, one per line")
             
@@ -370,7 +518,7 @@ Usage examples:
     print(f"Output file: {args.output}")
     print()
     
-    scraper = BitcoinDormantScraper()
+    scraper = BitcoinDormantScraper(verbose=args.verbose)
     
     try:
         addresses = scraper.scrape_dormant_addresses(
@@ -420,5 +568,4 @@ Usage examples:
         sys.exit(1)
 
 if __name__ == "__main__":
-    import json
     main()
@@ -4,155 +4,242 @@ Script to extract Bitcoin addresses with command line parameters
 """
 
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from urllib3.util.retry import Retry
 import time
-import re
+
+# httpx multiplexes all page fetches over one HTTP/2 connection; fall back if missing
+try:
+    import httpx
+except ImportError:
+    httpx = None
 import argparse
 import sys
-from typing import List, Dict
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+from typing import List, Dict, Optional
+
+# How many pages are fetched in parallel per batch
+FETCH_WORKERS = 8
+# Requests per second across all fetch workers
+FETCH_RATE = 5.0
+# How many worker processes parse fetched pages
+PARSE_WORKERS = min(FETCH_WORKERS, os.cpu_count() or 1)
+# Rows a BitInfoCharts top-list page holds, used to bound the page span up front
+ADDRESSES_PER_PAGE = 100
+
+HTTP_ERRORS = (requests.RequestException, httpx.HTTPError) if httpx else (requests.RequestException,)
+
+class RateLimiter:
+    """Token-bucket pacing shared by the concurrent fetch workers"""
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        """Blocks until the caller may issue its request"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+def parse_address_table(html_content: bytes, verbose: bool = False) -> List[str]:
+    """Parses the address table of a page
+
+    Module-level (not a method) so it can be dispatched to worker
+    processes, which need a picklable callable.
+    """
+    tree = lxml.html.fromstring(html_content)
+    addresses = []
+
+    # Both tables (tblOne and tblOne2) in a single traversal
+    tables = tree.xpath('//table[@id="tblOne" or @id="tblOne2"]')
+
+    # Fallback: search by class if not found by ID
+    if not tables:
+        tables = tree.xpath('//table[contains(@class, "table-striped") or contains(@class, "abtb")]')
+
+    if not tables:
+        print("No addresses table found")
+        return addresses
+
+    # Process each table
+    for table_idx, table in enumerate(tables):
+        # tr[td] excludes header rows (th-only) at libxml2 level
+        rows = table.xpath('.//tr[td]')
+
+        # Parsing rows
+        for i, row in enumerate(rows):
+            if len(row.xpath('td')) >= 2:
+                try:
+                    # One XPath pulls the address link out of the second cell
+                    hrefs = row.xpath('td[2]//a[contains(@href, "/bitcoin/address/")]/@href')
+
+                    if hrefs:
+                        # Extract complete address from URL
+                        address = hrefs[0].split('/bitcoin/address/')[-1]
+                    else:
+                        # Fallback: use cell text, dropping any trailing "wallet:..." label
+                        address = row.xpath('string(td[2])').strip()
+                        address = address.split('wallet:', 1)[0].strip()
+
+                    # Verify it's a valid Bitcoin address: known prefix and plausible length
+                    if address and address.startswith(('1', '3', 'bc1')) and 26 <= len(address) <= 62:
+                        addresses.append(address)
+                        # Per-row output dominates parse time on large scrapes
+                        if verbose:
+                            print(f"Address {len(addresses)} extracted from table {table_idx + 1}: {address}")
+                    elif verbose:
+                        print(f"DEBUG: Invalid address in table {table_idx + 1}, row {i+1}: '{address}'")
+
+                except Exception as e:
+                    print(f"ERROR in table {table_idx + 1}, row {i+1}: {e}")
+                    print(f"Row content: {row.text_content()[:200]}...")
+                    continue
+
+    print(f"Total addresses extracted from page: {len(addresses)}")
+    return addresses
+
+def parse_page(html_content: bytes, verbose: bool = False) -> Optional[List[str]]:
+    """Parse-pool entry point; None marks a page whose fetch failed"""
+    if not html_content:
+        return None
+    return parse_address_table(html_content, verbose)
 
 class BitcoinAddressScraperCLI:
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
         self.base_url = "https://bitinfocharts.com/top-100-richest-bitcoin-addresses.html"
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
+            # Brotli compresses the HTML tables far better than gzip; decoded
+            # transparently as long as the brotli package is installed
+            'Accept-Encoding': 'gzip, deflate, br'
         })
+        # Pool sized for the concurrent batch fetches, with retries on transient errors
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=2 * FETCH_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self.session.mount('https://', adapter)
+        # One HTTP/2 connection multiplexes all concurrent page fetches
+        if httpx is not None:
+            self.http_client = httpx.Client(
+                http2=True,
+                headers=dict(self.session.headers),
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=1)
+            )
+        else:
+            self.http_client = None
+        self.rate_limiter = RateLimiter(FETCH_RATE)
         self.addresses = []
+        self._seen = set()
         
-    def get_page_content(self, url: str) -> str:
-        """Retrieves the content of a page"""
+    def get_page_content(self, url: str) -> bytes:
+        """Retrieves the raw content of a page
+
+        Returns bytes: lxml parses them directly and skips a Unicode
+        decode pass over the whole document.
+        """
         try:
-            response = self.session.get(url, timeout=30)
+            if self.http_client is not None:
+                response = self.http_client.get(url)
+            else:
+                response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
+            return response.content
+        except HTTP_ERRORS as e:
             print(f"Error retrieving page {url}: {e}")
-            return ""
+            return b""
 
-    def parse_address_table(self, html_content: str) -> List[str]:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        addresses = []
-        
-        # Search for both tables: tblOne and tblOne2
-        tables = []
-        
-        # First table (tblOne)
-        table1 = soup.find('table', {'id': 'tblOne'})
-        if table1:
-            tables.append(table1)
-        
-        # Second table (tblOne2) 
-        table2 = soup.find('table', {'id': 'tblOne2'})
-        if table2:
-            tables.append(table2)
-        
-        # Fallback: search by class if not found by ID
-        if not tables:
-            fallback_tables = soup.find_all('table', {'class': ['table-striped', 'abtb']})
-            if fallback_tables:
-                tables = fallback_tables
-        
-        if not tables:
-            print("No addresses table found")
-            return addresses
-                
-        # Process each table
-        for table_idx, table in enumerate(tables):            
-            all_rows = table.find_all('tr')
-            
-            # Skip header if present
-            rows = all_rows
-            if all_rows and all_rows[0].find('th'):
-                rows = all_rows[1:]  # Skip header
-            
-            # Parsing rows
-            for i, row in enumerate(rows):
-                cells = row.find_all('td')
-                if len(cells) >= 2:
-                    try:
-                        address_cell = cells[1]
-                        
-                        # Search for Bitcoin address link
-                        address_link = None
-                        for link in address_cell.find_all('a'):
-                            href = link.get('href', '')
-                            if '/bitcoin/address/' in href:
-                                address_link = link
-                                break
-                        
-                        if address_link:
-                            # Extract complete address from URL
-                            href = address_link.get('href', '')
-                            address = href.split('/bitcoin/address/')[-1]
-                        else:
-                            # Fallback: use cell text
-                            address = address_cell.text.strip()
-                            address = re.sub(r'wallet:.*$', '', address).strip()
-                        
-                        # Verify it's a valid Bitcoin address
-                        if address and (address.startswith('1') or address.startswith('3') or address.startswith('bc1')):
-                            addresses.append(address)
-                            print(f"Address {len(addresses)} extracted from table {table_idx + 1}: {address}")
-                        else:
-                            print(f"DEBUG: Invalid address in table {table_idx + 1}, row {i+1}: '{address}'")
-                            
-                    except Exception as e:
-                        print(f"ERROR in table {table_idx + 1}, row {i+1}: {e}")
-                        print(f"Row content: {row.get_text()[:200]}...")
-                        continue
-        
-        print(f"Total addresses extracted from page: {len(addresses)}")
-        return addresses
+    def fetch_pages(self, urls: List[str]) -> List[bytes]:
+        """Fetches several pages concurrently, preserving the input order"""
+        def fetch(url: str) -> bytes:
+            self.rate_limiter.wait()
+            return self.get_page_content(url)
+
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            return list(executor.map(fetch, urls))
+
+    def parse_address_table(self, html_content: bytes) -> List[str]:
+        return parse_address_table(html_content, self.verbose)
+
+    def get_page_url(self, page: int) -> str:
+        """Builds the URL of a specific page"""
+        if page == 1:
+            return self.base_url
+        return f"https://bitinfocharts.com/top-100-richest-bitcoin-addresses-{page}.html"
 
-    def get_next_page_url(self, current_page: int) -> str:
-        """Finds the URL of the next page"""
-        
-        return f"https://bitinfocharts.com/top-100-richest-bitcoin-addresses-{current_page + 1}.html"
-    
     def scrape_addresses(self, max_addresses: int = 20000, start_page: int = 1) -> List[str]:
         """Scrapes addresses starting from a specific page"""
         print(f"Starting scraping for {max_addresses} addresses, starting from page {start_page}...")
-        
-        # Build initial URL
-        if start_page == 1:
-            current_url = self.base_url
-        else:
-            current_url = f"https://bitinfocharts.com/top-100-richest-bitcoin-addresses-{start_page}.html"
-        
+
         page_num = start_page
         total_addresses = 0
-        
-        while total_addresses < max_addresses:
-            print(f"\nScraping page {page_num}: {current_url}")
-            
-            html_content = self.get_page_content(current_url)
-            if not html_content:
-                print(f"Unable to retrieve page {page_num}")
-                break
-            
-            page_addresses = self.parse_address_table(html_content)
-            
-            if not page_addresses:
-                print(f"No address found on page {page_num}")
-                break
-            
-            for addr in page_addresses:
-                if total_addresses < max_addresses:
-                    self.addresses.append(addr)
-                    total_addresses += 1
-                else:
-                    break
-            
-            print(f"Addresses extracted so far: {total_addresses}")
-            
-            next_url = self.get_next_page_url(page_num)
-            
-            current_url = next_url
-            page_num += 1
-            
-            time.sleep(2)
-        
+        done = False
+
+        # Each page holds ~100 rows, so the page span needed to satisfy the cap
+        # is known up front and fetches never run past it
+        last_page = start_page + (max_addresses + ADDRESSES_PER_PAGE - 1) // ADDRESSES_PER_PAGE - 1
+
+        # One pipeline worker prefetches the next batch while this thread parses
+        # the current one, so network wait overlaps parse time; the process pool
+        # spreads the CPU-bound page parsing across cores
+        with ThreadPoolExecutor(max_workers=1) as pipeline, \
+             ProcessPoolExecutor(max_workers=PARSE_WORKERS) as parse_pool:
+            def submit_batch(first_page):
+                batch_end = min(first_page + FETCH_WORKERS, last_page + 1)
+                urls = [self.get_page_url(p) for p in range(first_page, batch_end)]
+                return pipeline.submit(self.fetch_pages, urls)
+
+            next_batch = submit_batch(page_num)
+
+            while not done and total_addresses < max_addresses and page_num <= last_page:
+                batch_pages = range(page_num, page_num + FETCH_WORKERS)
+                print(f"\nScraping pages {page_num}-{page_num + FETCH_WORKERS - 1}...")
+                pages = next_batch.result()
+                next_batch = submit_batch(page_num + FETCH_WORKERS)
+
+                parsed = parse_pool.map(partial(parse_page, verbose=self.verbose), pages)
+
+                for page, page_addresses in zip(batch_pages, parsed):
+                    if page_addresses is None:
+                        print(f"Unable to retrieve page {page}")
+                        done = True
+                        break
+
+                    if not page_addresses:
+                        print(f"No address found on page {page}")
+                        done = True
+                        break
+
+                    # Drop duplicates from pagination overlap, then take what fits
+                    # under the cap in one slice instead of a per-row counter loop
+                    remaining = max_addresses - total_addresses
+                    chunk = [a for a in dict.fromkeys(page_addresses) if a not in self._seen][:remaining]
+                    self._seen.update(chunk)
+                    self.addresses.extend(chunk)
+                    total_addresses += len(chunk)
+
+                    print(f"Addresses extracted so far: {total_addresses}")
+
+                    if total_addresses >= max_addresses:
+                        break
+
+                page_num += FETCH_WORKERS
+
+            next_batch.cancel()
+
         print(f"\nScraping completed. Total addresses extracted: {len(self.addresses)}")
         return self.addresses
     
@@ -163,10 +250,10 @@ class BitcoinAddressScraperCLI:
             action = "added to" if append else "overwritten"
             
             with open(filename, mode, encoding='utf-8') as f:
-                
-                for address in self.addresses:
-                    f.write(f"{address}\n")
-            
+                # One write call for the whole file instead of one per address
+                if self.addresses:
+                    f.write("\n".join(self.addresses) + "\n")
+
             print(f"Addresses {action} {filename}")
             print(f"File contains {len(self.addresses)} addresses, one per line")
             
@@ -239,7 +326,7 @@ Usage examples:
     print(f"Output file: {args.output}")
     print()
     
-    scraper = BitcoinAddressScraperCLI()
+    scraper = BitcoinAddressScraperCLI(verbose=args.verbose)
     
     try:
         addresses = scraper.scrape_addresses(
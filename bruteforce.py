@@ -1,38 +1,315 @@
 import sys
+import os
 import argparse
+import mmap
+import tempfile
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Pool
 
-from Gen import generate_bitcoin_address
+import base58
+from bech32 import bech32_decode, convertbits
 
-def read_file_to_set(filename: str) -> set:
+# Gen pulls in ecdsa and the hashing stack; imported in _worker_init so
+# argument errors, -h and the address-file load don't pay for it
+generate_batch = None
+
+# Candidate hash fields probed against the loaded index, paired with the
+# AddressRecord getter of the encoded address used for display on a hit
+# and a flag selecting the script-hash partition. Matching on raw HASH160
+# bytes means the index entries are 20 bytes instead of ~35-char strings,
+# and a hit on the compressed hash covers both the P2PKH and the bech32
+# form of the key. Ordered by expected hit rate: compressed P2PKH/bech32
+# dominate funded addresses, P2SH is the smaller class.
+KEYS = (
+    (attrgetter('compressed_hash160'), attrgetter('compressed_p2pkh_address'), False),
+    (attrgetter('script_hash160'), attrgetter('p2sh_address'), True),
+)
+
+# The obsolete uncompressed-pubkey P2PKH form is only generated and probed
+# behind --include-uncompressed, as the rarest class last
+UNCOMPRESSED_KEYS = KEYS + ((attrgetter('p2pkh_hash160'), attrgetter('p2pkh_address'), False),)
+
+# Files below this size load single-threaded; worker startup and result
+# merging only pay off on the multi-GB Blockchair dumps
+PARALLEL_LOAD_THRESHOLD = 256 << 20
+
+# Candidates generated per worker task; one task amortizes pool dispatch
+# and result handling across the whole batch
+BATCH_SIZE = 1024
+
+class BloomFilter:
+    """
+    Compact pre-filter in front of the address set.
+
+    Almost every candidate is a miss; a set probe for a miss lands in a
+    random hashtable bucket, while the bloom bit array answers most misses
+    from two or three cache lines. HASH160 entries are uniformly
+    distributed, so the probe positions are taken straight from slices of
+    the entry's own bytes instead of hashing again. Sized at ~32 bits per
+    entry with two probes, the false-positive rate is about 1e-3, and every
+    false positive is caught by the authoritative set behind it.
+    """
+
+    # Byte slices of the entry used as probe indices
+    PROBES = ((0, 8), (8, 16))
+
+    def __init__(self, entries):
+        bits = 1 << (max(len(entries) * 32, 64) - 1).bit_length()
+        self._mask = bits - 1
+        self._bits = bytearray(bits >> 3)
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: bytes):
+        for start, end in self.PROBES:
+            idx = int.from_bytes(entry[start:end], 'little') & self._mask
+            self._bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, entry: bytes) -> bool:
+        for start, end in self.PROBES:
+            idx = int.from_bytes(entry[start:end], 'little') & self._mask
+            if not self._bits[idx >> 3] & (1 << (idx & 7)):
+                return False
+        return True
+
+    def tobytes(self) -> bytes:
+        return bytes(self._bits)
+
+    @classmethod
+    def frombuffer(cls, buf) -> 'BloomFilter':
+        """Wraps an existing bit array (e.g. a read-only mmap) without copying"""
+        bloom = cls.__new__(cls)
+        bloom._mask = len(buf) * 8 - 1
+        bloom._bits = buf
+        return bloom
+
+def decode_to_hash160(address: bytes):
+    """
+    Decodes a textual Bitcoin address to its 20-byte payload hash.
+
+    Base58 addresses (1.../3...) yield the HASH160 after the version byte;
+    bech32 addresses (bc1...) yield the witness program. The checksum is not
+    verified: the input comes from trusted dumps and skipping it avoids a
+    double-SHA256 per address on multi-million-line files.
+
+    Returns (hash160, is_script) — is_script is True for P2SH addresses,
+    whose payload is a script hash rather than a pubkey hash — or None for
+    anything that doesn't decode to a 20-byte mainnet payload.
+    """
+    try:
+        if address.startswith(b'bc1'):
+            _, data = bech32_decode(address.decode('ascii'))
+            if not data:
+                return None
+            program = convertbits(data[1:], 5, 8, False)
+            if program is None or len(program) != 20:
+                return None
+            # P2WPKH: the witness program is a pubkey hash
+            return bytes(program), False
+
+        decoded = base58.b58decode(address)
+        if len(decoded) != 25:  # version byte + hash160 + 4-byte checksum
+            return None
+        if decoded[0] == 0x00:
+            return decoded[1:21], False
+        if decoded[0] == 0x05:
+            return decoded[1:21], True
+        return None
+    except ValueError:
+        return None
+
+def _parse_lines(buf: bytes) -> tuple:
+    """Decodes newline-separated addresses into (pubkey_hashes, script_hashes)"""
+    pubkey_hashes = set()
+    script_hashes = set()
+    for line in buf.split(b'\n'):
+        line = line.strip()
+        if line:
+            decoded = decode_to_hash160(line)
+            if decoded is not None:
+                h, is_script = decoded
+                (script_hashes if is_script else pubkey_hashes).add(h)
+    return pubkey_hashes, script_hashes
+
+def _load_range(filename: str, offset: int, length: int) -> tuple:
+    """Parallel-load worker: parses one byte range of the address file"""
+    with open(filename, 'rb') as file:
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return _parse_lines(mm[offset:offset + length])
+        finally:
+            mm.close()
+
+def read_file_to_sets(filename: str) -> tuple:
     """
-    Reads a text file line by line and returns a set with sanitized lines.
-    
+    Memory-maps an address file and returns its HASH160s partitioned by type.
+
+    Each line is decoded once at load time, so the bruteforce hot loop can
+    compare raw hashes and skip the Base58/Bech32 encoding entirely; the
+    entries also shrink from ~35-char strings to 20 bytes. Pubkey hashes
+    (1.../bc1...) and script hashes (3...) go to separate sets, so a
+    candidate only ever probes the partition its hash could legitimately
+    match.
+
     Args:
         filename (str): Path of the file to read
-        
+
     Returns:
-        set: Set containing all file lines without newline characters
-        
+        tuple: (pubkey_hashes, script_hashes) sets of 20-byte HASH160s
+
     Raises:
         FileNotFoundError: If the file doesn't exist
         IOError: If there are file reading problems
     """
-    lines_set = set()
-    
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line in file:
-                # Sanitize the line by removing \n and extra spaces
-                clean_line = line.strip()
-                if clean_line:  # Add only non-empty lines
-                    lines_set.add(clean_line)
-                    
+        with open(filename, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                return set(), set()
+
+            if size < PARALLEL_LOAD_THRESHOLD:
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    return _parse_lines(mm[:])
+                finally:
+                    mm.close()
+
+            # Large file: cut it into per-core byte ranges aligned to the
+            # next newline and parse each range in a worker process
+            workers = os.cpu_count() or 1
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                cuts = [0]
+                for i in range(1, workers):
+                    pos = mm.find(b'\n', size * i // workers)
+                    cuts.append(pos + 1 if pos >= 0 else size)
+                cuts.append(size)
+            finally:
+                mm.close()
+
+        pubkey_hashes = set()
+        script_hashes = set()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_load_range, filename, cuts[i], cuts[i + 1] - cuts[i])
+                for i in range(workers) if cuts[i + 1] > cuts[i]
+            ]
+            for future in futures:
+                pubkey_part, script_part = future.result()
+                pubkey_hashes |= pubkey_part
+                script_hashes |= script_part
+
     except FileNotFoundError:
         raise FileNotFoundError(f"File '{filename}' not found")
     except IOError as e:
         raise IOError(f"Error reading file '{filename}': {e}")
-    
-    return lines_set
+
+    return pubkey_hashes, script_hashes
+
+def write_index(pubkey_hashes: set, script_hashes: set) -> tuple:
+    """
+    Persists the loaded sets as shareable index files for the worker pool.
+
+    Each partition is the concatenation of its sorted 20-byte HASH160s;
+    the bloom file is a pre-filter bit array over both. Workers mmap all
+    three read-only, so the kernel keeps a single copy of the pages no
+    matter how many processes attach — instead of every worker re-parsing
+    the address file, or the forked parent sets being duplicated as
+    refcount writes defeat copy-on-write.
+
+    Returns (pubkey_path, script_path, bloom_path); the caller owns the files.
+    """
+    fd, pubkey_path = tempfile.mkstemp(prefix='pubkey_hashes_', suffix='.bin')
+    with os.fdopen(fd, 'wb') as file:
+        file.write(b''.join(sorted(pubkey_hashes)))
+
+    fd, script_path = tempfile.mkstemp(prefix='script_hashes_', suffix='.bin')
+    with os.fdopen(fd, 'wb') as file:
+        file.write(b''.join(sorted(script_hashes)))
+
+    fd, bloom_path = tempfile.mkstemp(prefix='bloom_', suffix='.bin')
+    with os.fdopen(fd, 'wb') as file:
+        file.write(BloomFilter(pubkey_hashes | script_hashes).tobytes())
+
+    return pubkey_path, script_path, bloom_path
+
+# Packed hash partitions, bloom pre-filter and generation options of the
+# current worker process, attached once by _worker_init
+_bloom = None
+_in_bloom = None
+_keys = ()
+_include_uncompressed = False
+
+def _attach_index(path: str):
+    """Maps one packed-hash partition read-only; returns (buffer, count)"""
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b'', 0
+        buf = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return buf, len(buf) // 20
+
+def _worker_init(pubkey_path: str, script_path: str, bloom_path: str,
+                 include_uncompressed: bool = False):
+    """Pool initializer: each worker attaches the shared index files"""
+    global generate_batch, _bloom, _in_bloom, _keys, _include_uncompressed
+    from Gen import generate_batch
+    partitions = {
+        False: _attach_index(pubkey_path),
+        True: _attach_index(script_path),
+    }
+    with open(bloom_path, 'rb') as file:
+        _bloom = BloomFilter.frombuffer(
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    _in_bloom = _bloom.__contains__
+    _include_uncompressed = include_uncompressed
+    # Resolve each probe's partition once, not per candidate
+    _keys = tuple(
+        (get_hash, get_address) + partitions[is_script]
+        for get_hash, get_address, is_script
+        in (UNCOMPRESSED_KEYS if include_uncompressed else KEYS)
+    )
+
+def _index_contains(index, count: int, h: bytes) -> bool:
+    """Binary search for a 20-byte hash in one sorted packed partition"""
+    lo, hi = 0, count
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if index[mid * 20:mid * 20 + 20] < h:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo < count and index[lo * 20:lo * 20 + 20] == h
+
+def _search(records, keys, in_bloom, search_index=_index_contains) -> list:
+    """Probes a batch of AddressRecords against the loaded index partitions
+
+    The hot loop proper: everything it touches arrives as an argument (the
+    binary search is bound as a default), so the loop body reads only
+    locals — no I/O, no module-global lookups — which is the shape tracing
+    JITs inline well and the single seam to compile if this module ever
+    grows a native backend.
+
+    Returns the list of (matched address, AddressRecord) pairs — empty for
+    the overwhelmingly common all-miss batch.
+    """
+    hits = []
+    for record in records:
+        # Probe the bloom filter first; a partition is only searched on the rare
+        # positive, so almost every candidate is rejected without a binary search
+        for get_hash, get_address, index, index_count in keys:
+            h = get_hash(record)
+            if in_bloom(h) and search_index(index, index_count, h):
+                hits.append((get_address(record), record))
+    return hits
+
+def _check_batch(count: int) -> tuple:
+    """Generates a batch of addresses and checks them against the loaded set
+
+    Returns (count, hits) as produced by _search.
+    """
+    return count, _search(generate_batch(count, _include_uncompressed),
+                          _keys, _in_bloom)
 
 def main():
     """Main function with argument parsing"""
@@ -61,6 +338,13 @@ Usage examples:
         help='Maximum number of addresses to bruteforce (default: 20000)'
     )
 
+    parser.add_argument(
+        '--include-uncompressed',
+        action='store_true',
+        help='Also generate and check the obsolete uncompressed-pubkey '
+             'P2PKH form (costs an extra hash pipeline per candidate)'
+    )
+
     args = parser.parse_args()
 
      # Parameter validation
@@ -68,31 +352,51 @@ Usage examples:
         print("Error: Number of addresses must be positive")
         sys.exit(1)
 
-    addresses = read_file_to_set(args.file)
-
-    print(f"File '{args.file}' loaded with {len(addresses)} addresses")
-
-    for i in range(args.num_addresses):
-        print(f"Generating address {i+1} of {args.num_addresses}")
-        bitcoin_address = generate_bitcoin_address()
-
-        print(f"Address generated, private key: {bitcoin_address['private_key']}")
-        k = ['p2pkh_address', 'compressed_p2pkh_address', 'p2sh_address', 'bech32_address']
-
-        for key in k:
-            print(f"Checking {key}: {bitcoin_address[key]}")
-            if bitcoin_address[key] in addresses:
-                print("=" * 50)
-                print("=" * 50)
-                print("=" * 50)
-                print("=" * 50)
-                print(f"Address {bitcoin_address[key]} found in {args.file}")
-                print(f"Private key: {bitcoin_address['private_key']}")
-                print("=" * 50)
-                print("=" * 50)
-                print("=" * 50)
-                print("=" * 50)
-                break
+    pubkey_hashes, script_hashes = read_file_to_sets(args.file)
+
+    print(f"File '{args.file}' loaded with "
+          f"{len(pubkey_hashes) + len(script_hashes)} addresses")
+
+    # The file is parsed exactly once, here; workers only mmap the result
+    index_paths = write_index(pubkey_hashes, script_hashes)
+    del pubkey_hashes, script_hashes
+
+    # One task per batch of candidates instead of one per candidate: the
+    # pool ships a handful of ints to the workers and gets back one small
+    # result per batch
+    batches = [BATCH_SIZE] * (args.num_addresses // BATCH_SIZE)
+    if args.num_addresses % BATCH_SIZE:
+        batches.append(args.num_addresses % BATCH_SIZE)
+
+    try:
+        # The search is embarrassingly parallel: every worker generates and
+        # checks candidates independently, so the pool scales with core count
+        with Pool(processes=os.cpu_count(), initializer=_worker_init,
+                  initargs=(*index_paths, args.include_uncompressed)) as pool:
+            results = pool.imap_unordered(_check_batch, batches)
+
+            checked = 0
+            for count, hits in results:
+                checked += count
+                sys.stderr.write(f"\rChecked {checked}/{args.num_addresses} addresses")
+                sys.stderr.flush()
+
+                for address, bitcoin_address in hits:
+                    print("=" * 50)
+                    print("=" * 50)
+                    print("=" * 50)
+                    print("=" * 50)
+                    print(f"Address {address} found in {args.file}")
+                    print(f"Private key: {bitcoin_address.private_key}")
+                    print("=" * 50)
+                    print("=" * 50)
+                    print("=" * 50)
+                    print("=" * 50)
+    finally:
+        for path in index_paths:
+            os.unlink(path)
+
+    sys.stderr.write("\n")
 
 
 